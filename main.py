@@ -1,20 +1,30 @@
 import os
 import json
 import asyncio
+import queue
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, asdict
+import re
 import uuid
-from tkinter import ttk, messagebox
-from calendar import Calendar as TkCalendar
+from functools import lru_cache, partial
+from tkinter import ttk, messagebox, filedialog
+from calendar import Calendar as TkCalendar, month_name
 from datetime import date
 
 import customtkinter as ctk 
 from PIL import Image
-from playwright.async_api import async_playwright
-from apscheduler.schedulers.background import BackgroundScheduler
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 ctk.set_appearance_mode("System")
@@ -32,6 +42,54 @@ COLORS = {
     "text_secondary": "#cccccc",
 }
 
+HOURS = tuple(f"{i:02d}" for i in range(24))
+MINUTES = tuple(f"{i:02d}" for i in range(60))
+MONTHS = tuple(month_name[i] for i in range(1, 13))
+
+_SCHEDULE_MAP = {
+    "Every Minute": "* * * * *",
+    "Every Hour": "0 * * * *",
+    "Daily": "0 0 * * *",
+    "Weekly": "0 0 * * 0",
+}
+
+_DEFAULT_OUTPUT_PATH = str(Path.home() / "Documents" / "Screenshots")
+
+_CRON_FIELD_RE = re.compile(r"^[0-9A-Za-z*/,\-]+$")
+_INVALID_CRONS: Set[str] = set()
+
+
+def _parse_dim(entry) -> Optional[int]:
+    try:
+        value = int(entry.get())
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def _is_valid_cron(cron: str) -> bool:
+    if cron in _INVALID_CRONS:
+        return False
+    
+    cron_parts = cron.strip().split(maxsplit=4)
+    if len(cron_parts) == 5 and all(_CRON_FIELD_RE.match(part) for part in cron_parts):
+        return True
+    
+    _INVALID_CRONS.add(cron)
+    return False
+
+
+@lru_cache(maxsize=256)
+def _make_cron_trigger(cron: str) -> CronTrigger:
+    minute, hour, day, month, day_of_week = cron.strip().split(maxsplit=4)
+    return CronTrigger(
+        minute=minute,
+        hour=hour,
+        day=day,
+        month=month,
+        day_of_week=day_of_week
+    )
+
 
 @dataclass
 class ScreenshotTask:
@@ -43,6 +101,14 @@ class ScreenshotTask:
     height: int = 1080
     full_page: bool = True
     enabled: bool = True
+    wait_strategy: str = "load"
+    settle_ms: int = 0
+    image_format: str = "png"
+    quality: int = 85
+    nav_timeout_ms: int = 15000
+    
+    def __post_init__(self):
+        self.output_dir = Path(self.output_path)
     
     def to_dict(self) -> dict:
         return asdict(self)
@@ -60,85 +126,224 @@ class ConfigManager:
             config_path = config_dir / "config.json"
         
         self.config_path = config_path
+        self._save_lock = threading.Lock()
+        self._save_timer = None
+        self._pending = None
         self.config = self.load_config()
+        self._tasks: Dict[str, ScreenshotTask] = {
+            t["id"]: ScreenshotTask.from_dict(t) for t in self.config.get("tasks", [])
+        }
     
     def load_config(self) -> dict:
-        if self.config_path.exists():
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
-        return self.get_default_config()
+        try:
+            data = self.config_path.read_bytes()
+        except FileNotFoundError:
+            return self.get_default_config()
+        
+        if orjson:
+            return orjson.loads(data)
+        return json.loads(data)
     
     def get_default_config(self) -> dict:
-        output_dir = Path.home() / "Documents" / "Screenshots"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        Path(_DEFAULT_OUTPUT_PATH).mkdir(parents=True, exist_ok=True)
         
         return {
             "tasks": [],
             "dark_mode": True,
-            "output_directory": str(output_dir),
+            "output_directory": _DEFAULT_OUTPUT_PATH,
             "default_width": 1920,
             "default_height": 1080,
             "window_width": 1280,
-            "window_height": 720
+            "window_height": 720,
+            "max_concurrent_captures": 4
         }
     
     def save_config(self):
-        with open(self.config_path, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        with self._save_lock:
+            self._pending = dict(self.config)
+            if self._save_timer:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(0.5, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self):
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            config, self._pending = self._pending, None
+            if config is None:
+                return
+            if orjson:
+                self.config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+                return
+            with open(self.config_path, 'w') as f:
+                json.dump(config, f, indent=2)
     
     def get_tasks(self) -> List[ScreenshotTask]:
-        return [ScreenshotTask.from_dict(t) for t in self.config.get("tasks", [])]
+        return list(self._tasks.values())
     
     def add_task(self, task: ScreenshotTask):
-        tasks = self.get_tasks()
-        tasks.append(task)
-        self.config["tasks"] = [t.to_dict() for t in tasks]
-        self.save_config()
+        self._tasks[task.id] = task
+        self._save_tasks()
     
     def remove_task(self, task_id: str):
-        tasks = self.get_tasks()
-        tasks = [t for t in tasks if t.id != task_id]
-        self.config["tasks"] = [t.to_dict() for t in tasks]
-        self.save_config()
+        self._tasks.pop(task_id, None)
+        self._save_tasks()
     
     def update_task(self, task: ScreenshotTask):
-        tasks = self.get_tasks()
-        for i, t in enumerate(tasks):
-            if t.id == task.id:
-                tasks[i] = task
-                break
-        self.config["tasks"] = [t.to_dict() for t in tasks]
+        if task.id in self._tasks:
+            self._tasks[task.id] = task
+            self._save_tasks()
+    
+    def _save_tasks(self):
+        self.config["tasks"] = [t.to_dict() for t in self._tasks.values()]
         self.save_config()
 
 
 class ScreenshotCapture:
-    def __init__(self):
-        self._capture_lock = threading.Lock()
+    def __init__(self, max_parallel: int = 4, max_contexts: int = 4, max_idle_pages: int = 8):
+        self._max_parallel = max_parallel
+        self._max_contexts = max_contexts
+        self._max_idle_pages = max_idle_pages
+        self._pw = None
+        self._browser = None
+        self._lock = None
+        self._semaphore = None
+        self._ctx_pool = OrderedDict()
+        self._ctx_users: Dict[tuple, int] = {}
+        self._page_pool: Dict[tuple, asyncio.LifoQueue] = {}
+        self._ensured_dirs: Set[Path] = set()
+    
+    async def _ensure_browser(self):
+        if self._browser is None or not self._browser.is_connected():
+            self._ctx_pool.clear()
+            self._page_pool.clear()
+            if self._pw is None:
+                self._pw = await async_playwright().start()
+            self._browser = await self._pw.chromium.launch(headless=True)
+        return self._browser
+    
+    async def _acquire_context(self, task: ScreenshotTask):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        
+        key = (task.width, task.height)
+        viewport = {"width": task.width, "height": task.height}
+        async with self._lock:
+            browser = await self._ensure_browser()
+            context = self._ctx_pool.get(key)
+            if context is None:
+                try:
+                    context = await browser.new_context(viewport=viewport)
+                except PlaywrightError:
+                    if browser.is_connected():
+                        raise
+                    print("Browser connection lost, relaunching")
+                    browser = await self._ensure_browser()
+                    context = await browser.new_context(viewport=viewport)
+                self._ctx_pool[key] = context
+            
+            self._ctx_pool.move_to_end(key)
+            self._ctx_users[key] = self._ctx_users.get(key, 0) + 1
+            await self._evict_contexts()
+            return key, context
+    
+    def _release_context(self, key: tuple):
+        self._ctx_users[key] -= 1
+    
+    async def _evict_contexts(self):
+        for key in list(self._ctx_pool):
+            if len(self._ctx_pool) <= self._max_contexts:
+                break
+            if self._ctx_users.get(key):
+                continue
+            context = self._ctx_pool.pop(key)
+            self._page_pool.pop(key, None)
+            try:
+                await context.close()
+            except:
+                pass
+    
+    async def _acquire_page(self, key: tuple, context):
+        pages = self._page_pool.get(key)
+        if pages is None:
+            pages = self._page_pool[key] = asyncio.LifoQueue(maxsize=self._max_idle_pages)
+        
+        while not pages.empty():
+            page = pages.get_nowait()
+            if not page.is_closed():
+                return page
+        return await context.new_page()
+    
+    async def _release_page(self, key: tuple, page):
+        pages = self._page_pool.get(key)
+        if pages is not None and not pages.full():
+            try:
+                await page.goto("about:blank")
+                pages.put_nowait(page)
+                return
+            except:
+                pass
+        try:
+            await page.close()
+        except:
+            pass
     
     async def capture(self, task: ScreenshotTask) -> bool:
-        playwright = None
-        browser = None
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_parallel)
+        
+        async with self._semaphore:
+            return await self._capture(task)
+    
+    async def _capture(self, task: ScreenshotTask) -> bool:
+        key = None
         page = None
         try:
-            playwright = await async_playwright().start()
-            browser = await playwright.chromium.launch(headless=True)
-            page = await browser.new_page()
+            key, context = await self._acquire_context(task)
+            page = await self._acquire_page(key, context)
             
-            await page.set_viewport_size({"width": task.width, "height": task.height})
+            page.set_default_navigation_timeout(task.nav_timeout_ms)
             
             print(f"Capturing: {task.url}")
-            await page.goto(task.url, wait_until="networkidle", timeout=30000)
+            started = time.monotonic()
+            try:
+                await page.goto(task.url, wait_until=task.wait_strategy)
+            except PlaywrightTimeoutError:
+                elapsed = time.monotonic() - started
+                print(f"Warning: {task.url} did not reach '{task.wait_strategy}' after {elapsed:.1f}s, capturing anyway")
+            if task.settle_ms:
+                await page.wait_for_timeout(task.settle_ms)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{task.id}_{timestamp}.png"
-            output_file = Path(task.output_path) / filename
+            stamp = f"{int(time.time() * 1000):x}"
+            extension = "jpg" if task.image_format == "jpeg" else task.image_format
+            filename = f"{task.id}_{stamp}.{extension}"
+            output_file = task.output_dir / filename
             
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            if task.output_dir not in self._ensured_dirs:
+                task.output_dir.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(task.output_dir)
             
-            await page.screenshot(
-                path=str(output_file),
-                full_page=task.full_page
-            )
+            screenshot_kwargs = {
+                "full_page": task.full_page,
+                "type": task.image_format
+            }
+            if task.image_format != "png":
+                screenshot_kwargs["quality"] = task.quality
+            
+            data = await page.screenshot(**screenshot_kwargs)
+            await self._release_page(key, page)
+            page = None
+            
+            try:
+                await asyncio.to_thread(output_file.write_bytes, data)
+            except FileNotFoundError:
+                self._ensured_dirs.discard(task.output_dir)
+                task.output_dir.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(task.output_dir)
+                await asyncio.to_thread(output_file.write_bytes, data)
             
             print(f"Saved: {output_file}")
             return True
@@ -154,35 +359,76 @@ class ScreenshotCapture:
                     await page.close()
                 except:
                     pass
-            if browser:
-                try:
-                    await browser.close()
-                except:
-                    pass
-            if playwright:
-                try:
-                    await playwright.stop()
-                except:
-                    pass
+            if key:
+                self._release_context(key)
     
-    def close(self):
-        pass
+    async def close(self):
+        self._ctx_pool.clear()
+        self._page_pool.clear()
+        if self._browser:
+            try:
+                await self._browser.close()
+            except:
+                pass
+            self._browser = None
+        if self._pw:
+            try:
+                await self._pw.stop()
+            except:
+                pass
+            self._pw = None
 
 
 class App(ctk.CTk):
     def __init__(self):
         super().__init__()
         
+        self.fonts = {
+            "s11": ctk.CTkFont(size=11),
+            "s11b": ctk.CTkFont(size=11, weight="bold"),
+            "s12": ctk.CTkFont(size=12),
+            "s12b": ctk.CTkFont(size=12, weight="bold"),
+            "s13b": ctk.CTkFont(size=13, weight="bold"),
+            "s14": ctk.CTkFont(size=14),
+            "s14b": ctk.CTkFont(size=14, weight="bold"),
+            "s15": ctk.CTkFont(size=15),
+            "s16": ctk.CTkFont(size=16),
+            "s16b": ctk.CTkFont(size=16, weight="bold"),
+            "s20b": ctk.CTkFont(size=20, weight="bold"),
+            "s24b": ctk.CTkFont(size=24, weight="bold"),
+            "s28b": ctk.CTkFont(size=28, weight="bold"),
+        }
+        
         self.config_manager = ConfigManager()
-        self.capture = ScreenshotCapture()
-        self.scheduler = BackgroundScheduler()
+        self.capture = ScreenshotCapture(
+            max_parallel=self.config_manager.config.get("max_concurrent_captures", 4)
+        )
+        
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name="capture-loop", daemon=True)
+        self._loop_thread.start()
+        self.scheduler = AsyncIOScheduler(event_loop=self._loop)
+        
+        self._task_rows: Dict[str, dict] = {}
+        self._dashboard_cards: Dict[str, dict] = {}
+        self._dashboard_empty_label = None
+        self._cal_window = None
+        self._success_dialog = None
+        self._error_dialog = None
+        self._capturing: Set[str] = set()
+        self._scheduled: Dict[str, ScreenshotTask] = {}
+        self._preview_after_id = None
+        self._today_str = datetime.now().strftime("%Y-%m-%d")
+        self._today_after_id = self.after(60_000, self.refresh_today)
+        self._status_queue = queue.SimpleQueue()
         
         self.init_ui()
         self.schedule_option.set("Every Hour")
         self.update_cron_preview()
         self.load_saved_config()
         self.load_scheduled_tasks()
-        self.scheduler.start()
+        self.poll_status()
+        self._loop.call_soon_threadsafe(self.scheduler.start)
         
         self.protocol("WM_DELETE_WINDOW", self.on_close)
         print("Application started")
@@ -217,7 +463,7 @@ class App(ctk.CTk):
         title_label = ctk.CTkLabel(
             header_frame,
             text="📸 Screenshot Scheduler Pro",
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=self.fonts["s28b"],
             text_color="white"
         )
         title_label.grid(row=0, column=0, padx=20, pady=15)
@@ -272,7 +518,7 @@ class App(ctk.CTk):
         self.total_tasks_label = ctk.CTkLabel(
             stats_frame,
             text="📊 Total Tasks: 0",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.fonts["s16b"],
             text_color=COLORS["text_primary"]
         )
         self.total_tasks_label.pack(side="left", padx=25, pady=15)
@@ -305,14 +551,14 @@ class App(ctk.CTk):
         ctk.CTkLabel(
             left_frame,
             text="✨ Add New Task",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self.fonts["s20b"],
             text_color=COLORS["text_primary"]
         ).pack(pady=20)
         
         ctk.CTkLabel(
             left_frame, 
             text="URL:", 
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.fonts["s12b"],
             text_color=COLORS["text_secondary"]
         ).pack(pady=(10, 5))
         self.url_entry = ctk.CTkEntry(
@@ -328,7 +574,7 @@ class App(ctk.CTk):
         ctk.CTkLabel(
             left_frame, 
             text="Schedule:", 
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.fonts["s12b"],
             text_color=COLORS["text_secondary"]
         ).pack(pady=(20, 5))
         
@@ -361,7 +607,7 @@ class App(ctk.CTk):
         ctk.CTkLabel(
             date_time_frame, 
             text="Date:", 
-            font=ctk.CTkFont(size=11),
+            font=self.fonts["s11"],
             text_color=COLORS["text_secondary"]
         ).pack(side="left", padx=5)
         self.date_entry = ctk.CTkEntry(
@@ -372,7 +618,7 @@ class App(ctk.CTk):
             corner_radius=6
         )
         self.date_entry.pack(side="left", padx=5)
-        self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self.date_entry.insert(0, self._today_str)
         
         date_btn = ctk.CTkButton(
             date_time_frame,
@@ -392,12 +638,12 @@ class App(ctk.CTk):
         ctk.CTkLabel(
             time_frame, 
             text="Hour:", 
-            font=ctk.CTkFont(size=11),
+            font=self.fonts["s11"],
             text_color=COLORS["text_secondary"]
         ).pack(side="left", padx=5)
         self.hour_spinbox = ctk.CTkOptionMenu(
             time_frame,
-            values=[f"{i:02d}" for i in range(24)],
+            values=HOURS,
             width=80,
             height=35,
             corner_radius=6,
@@ -408,17 +654,17 @@ class App(ctk.CTk):
         )
         self.hour_spinbox.pack(side="left", padx=5)
         self.hour_spinbox.set("00")
-        self.hour_spinbox.configure(command=lambda v: self.update_cron_preview())
+        self.hour_spinbox.configure(command=lambda v: self.queue_cron_preview())
         
         ctk.CTkLabel(
             time_frame, 
             text="Minute:", 
-            font=ctk.CTkFont(size=11),
+            font=self.fonts["s11"],
             text_color=COLORS["text_secondary"]
         ).pack(side="left", padx=5)
         self.minute_spinbox = ctk.CTkOptionMenu(
             time_frame,
-            values=[f"{i:02d}" for i in range(60)],
+            values=MINUTES,
             width=80,
             height=35,
             corner_radius=6,
@@ -429,12 +675,12 @@ class App(ctk.CTk):
         )
         self.minute_spinbox.pack(side="left", padx=5)
         self.minute_spinbox.set("00")
-        self.minute_spinbox.configure(command=lambda v: self.update_cron_preview())
+        self.minute_spinbox.configure(command=lambda v: self.queue_cron_preview())
         
         self.cron_preview_label = ctk.CTkLabel(
             left_frame,
             text="⏰ Cron: 0 * * * *",
-            font=ctk.CTkFont(size=11),
+            font=self.fonts["s11"],
             text_color=COLORS["text_secondary"]
         )
         self.cron_preview_label.pack(pady=10)
@@ -445,7 +691,7 @@ class App(ctk.CTk):
         ctk.CTkLabel(
             dimensions_frame, 
             text="W:", 
-            font=ctk.CTkFont(size=11),
+            font=self.fonts["s11"],
             text_color=COLORS["text_secondary"]
         ).pack(side="left", padx=5)
         self.width_entry = ctk.CTkEntry(
@@ -460,7 +706,7 @@ class App(ctk.CTk):
         ctk.CTkLabel(
             dimensions_frame, 
             text="H:", 
-            font=ctk.CTkFont(size=11),
+            font=self.fonts["s11"],
             text_color=COLORS["text_secondary"]
         ).pack(side="left", padx=5)
         self.height_entry = ctk.CTkEntry(
@@ -483,6 +729,29 @@ class App(ctk.CTk):
             hover_color=COLORS["secondary"]
         ).pack(pady=10)
         
+        format_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
+        format_frame.pack(pady=5)
+        
+        ctk.CTkLabel(
+            format_frame, 
+            text="Format:", 
+            font=self.fonts["s11"],
+            text_color=COLORS["text_secondary"]
+        ).pack(side="left", padx=5)
+        self.format_option = ctk.CTkOptionMenu(
+            format_frame,
+            values=["PNG", "JPEG"],
+            width=100,
+            height=35,
+            corner_radius=6,
+            fg_color=COLORS["bg_card"],
+            button_color=COLORS["primary"],
+            button_hover_color=COLORS["secondary"],
+            dropdown_fg_color=COLORS["bg_card"]
+        )
+        self.format_option.pack(side="left", padx=5)
+        self.format_option.set("PNG")
+        
         add_btn = ctk.CTkButton(
             left_frame,
             text="➕ Add Task",
@@ -491,7 +760,7 @@ class App(ctk.CTk):
             corner_radius=8,
             fg_color=COLORS["success"],
             hover_color="#2ea070",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.fonts["s14b"]
         )
         add_btn.pack(pady=20, padx=20, fill="x")
         
@@ -505,7 +774,7 @@ class App(ctk.CTk):
         ctk.CTkLabel(
             right_frame,
             text="📋 Existing Tasks",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self.fonts["s20b"],
             text_color=COLORS["text_primary"]
         ).pack(pady=20)
         
@@ -531,14 +800,14 @@ class App(ctk.CTk):
         ctk.CTkLabel(
             settings_frame,
             text="⚙️ Settings",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self.fonts["s24b"],
             text_color=COLORS["text_primary"]
         ).pack(pady=20)
         
         ctk.CTkLabel(
             settings_frame, 
             text="Output Directory:", 
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.fonts["s14b"],
             text_color=COLORS["text_secondary"]
         ).pack(pady=(15, 5))
         self.output_path_entry = ctk.CTkEntry(
@@ -588,43 +857,49 @@ class App(ctk.CTk):
             self.status_frame,
             text="✓ Ready",
             anchor="w",
-            font=ctk.CTkFont(size=12),
+            font=self.fonts["s12"],
             text_color=COLORS["text_secondary"]
         )
         self.status_label.pack(side="left", padx=15, pady=8)
     
     def open_calendar(self):
-        from tkinter import Toplevel, Spinbox
-        from calendar import monthcalendar, month_name
+        self._cal_date = datetime.now()
+        
+        if self._cal_window is None:
+            self.create_calendar_window()
+        else:
+            self._cal_window.deiconify()
+        
+        self._cal_month_spin.set(month_name[self._cal_date.month])
+        self._cal_year_entry.delete(0, "end")
+        self._cal_year_entry.insert(0, str(self._cal_date.year))
+        self._cal_window.grab_set()
+        self.draw_calendar()
+    
+    def create_calendar_window(self):
+        from tkinter import Toplevel
         
         calendar_window = Toplevel(self)
         calendar_window.title("Select Date")
         calendar_window.geometry("320x380")
         calendar_window.transient(self)
-        calendar_window.grab_set()
+        calendar_window.protocol("WM_DELETE_WINDOW", self.close_calendar)
         
         calendar_window.configure(bg=COLORS["bg_card"])
         
-        selected_date = [datetime.now()]
-        
         header_frame = ctk.CTkFrame(calendar_window, fg_color=COLORS["primary"], corner_radius=0)
         header_frame.pack(fill="x")
         
-        month_var = ctk.StringVar(value=month_name[selected_date[0].month])
-        year_var = ctk.StringVar(value=str(selected_date[0].year))
-        
         month_spin = ctk.CTkOptionMenu(
             header_frame,
-            values=[month_name[i] for i in range(1, 13)],
-            variable=month_var,
-            command=lambda v: update_calendar(),
+            values=MONTHS,
+            command=lambda v: self.update_calendar(),
             width=120,
             fg_color=COLORS["secondary"],
             button_color=COLORS["secondary"],
             button_hover_color=COLORS["primary"]
         )
         month_spin.pack(side="left", padx=10, pady=10)
-        month_spin.set(month_name[selected_date[0].month])
         
         year_entry = ctk.CTkEntry(
             header_frame,
@@ -632,107 +907,106 @@ class App(ctk.CTk):
             placeholder_text="Year"
         )
         year_entry.pack(side="left", padx=10, pady=10)
-        year_entry.insert(0, str(selected_date[0].year))
-        
-        def update_calendar():
-            try:
-                m = [i for i in range(1, 13) if month_name[i] == month_var.get()][0]
-                y = int(year_entry.get())
-                selected_date[0] = selected_date[0].replace(year=y, month=m)
-                draw_calendar()
-            except:
-                pass
-        
-        def draw_calendar():
-            for widget in cal_frame.winfo_children():
-                widget.destroy()
-            
-            days = ["Su", "Mo", "Tu", "We", "Th", "Fr", "Sa"]
-            for i, day in enumerate(days):
-                ctk.CTkLabel(
-                    cal_frame, 
-                    text=day, 
-                    width=40, 
-                    font=ctk.CTkFont(size=11, weight="bold"),
-                    text_color=COLORS["text_secondary"]
-                ).grid(row=0, column=i, pady=5)
-            
-            cal_days = monthcalendar(selected_date[0].year, selected_date[0].month)
-            for week_idx, week in enumerate(cal_days):
-                for day_idx, day in enumerate(week):
-                    if day == 0:
-                        ctk.CTkLabel(cal_frame, text="", width=40).grid(row=week_idx+1, column=day_idx)
-                    else:
-                        is_today = (day == datetime.now().day and 
-                                   selected_date[0].month == datetime.now().month and 
-                                   selected_date[0].year == datetime.now().year)
-                        
-                        btn = ctk.CTkButton(
-                            cal_frame,
-                            text=str(day),
-                            width=40,
-                            height=35,
-                            corner_radius=6,
-                            fg_color=COLORS["primary"] if is_today else COLORS["bg_card_light"],
-                            hover_color=COLORS["secondary"] if is_today else COLORS["primary"],
-                            text_color="white" if is_today else COLORS["text_primary"],
-                            command=lambda d=day: select_day(d)
-                        )
-                        btn.grid(row=week_idx+1, column=day_idx, pady=2, padx=2)
-        
-        def select_day(day):
-            selected_date[0] = selected_date[0].replace(day=day)
-            self.date_entry.delete(0, "end")
-            self.date_entry.insert(0, selected_date[0].strftime("%Y-%m-%d"))
-            self.update_cron_preview()
-            calendar_window.destroy()
         
         cal_frame = ctk.CTkFrame(calendar_window, fg_color=COLORS["bg_card"])
         cal_frame.pack(padx=10, pady=10, fill="both", expand=True)
         
-        draw_calendar()
-        
-        def on_cancel():
-            calendar_window.destroy()
-        
         ctk.CTkButton(
             calendar_window,
             text="Cancel",
-            command=on_cancel,
+            command=self.close_calendar,
             height=35,
             fg_color=COLORS["accent"],
             hover_color="#d91e24",
             corner_radius=6
         ).pack(pady=10, padx=10, fill="x")
-
+        
+        self._cal_window = calendar_window
+        self._cal_month_spin = month_spin
+        self._cal_year_entry = year_entry
+        self._cal_frame = cal_frame
+    
+    def update_calendar(self):
+        try:
+            m = MONTHS.index(self._cal_month_spin.get()) + 1
+            y = int(self._cal_year_entry.get())
+            self._cal_date = self._cal_date.replace(year=y, month=m)
+            self.draw_calendar()
+        except:
+            pass
+    
+    def draw_calendar(self):
+        from calendar import monthcalendar
+        
+        cal_frame = self._cal_frame
+        for widget in cal_frame.winfo_children():
+            widget.destroy()
+        
+        days = ["Su", "Mo", "Tu", "We", "Th", "Fr", "Sa"]
+        for i, day in enumerate(days):
+            ctk.CTkLabel(
+                cal_frame, 
+                text=day, 
+                width=40, 
+                font=self.fonts["s11b"],
+                text_color=COLORS["text_secondary"]
+            ).grid(row=0, column=i, pady=5)
+        
+        today = datetime.now()
+        cal_days = monthcalendar(self._cal_date.year, self._cal_date.month)
+        for week_idx, week in enumerate(cal_days):
+            for day_idx, day in enumerate(week):
+                if day == 0:
+                    ctk.CTkLabel(cal_frame, text="", width=40).grid(row=week_idx+1, column=day_idx)
+                else:
+                    is_today = (day == today.day and 
+                               self._cal_date.month == today.month and 
+                               self._cal_date.year == today.year)
+                    
+                    btn = ctk.CTkButton(
+                        cal_frame,
+                        text=str(day),
+                        width=40,
+                        height=35,
+                        corner_radius=6,
+                        fg_color=COLORS["primary"] if is_today else COLORS["bg_card_light"],
+                        hover_color=COLORS["secondary"] if is_today else COLORS["primary"],
+                        text_color="white" if is_today else COLORS["text_primary"],
+                        command=partial(self.select_day, day)
+                    )
+                    btn.grid(row=week_idx+1, column=day_idx, pady=2, padx=2)
+    
+    def select_day(self, day: int):
+        self._cal_date = self._cal_date.replace(day=day)
+        self.date_entry.delete(0, "end")
+        self.date_entry.insert(0, self._cal_date.strftime("%Y-%m-%d"))
+        self.update_cron_preview()
+        self.close_calendar()
+    
+    def close_calendar(self):
+        self._cal_window.grab_release()
+        self._cal_window.withdraw()
+    
     def on_schedule_change(self, option):
         if option == "Custom":
             self.custom_schedule_frame.pack(fill="x", padx=20, pady=5)
         else:
             self.custom_schedule_frame.pack_forget()
         
-        self.update_cron_preview()
+        self.queue_cron_preview()
+    
+    def refresh_today(self):
+        self._today_str = datetime.now().strftime("%Y-%m-%d")
+        self._today_after_id = self.after(60_000, self.refresh_today)
+    
+    def queue_cron_preview(self):
+        if self._preview_after_id:
+            self.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.after(150, self.update_cron_preview)
     
     def update_cron_preview(self):
-        option = self.schedule_option.get()
-        cron = ""
-        
-        if option == "Every Minute":
-            cron = "* * * * *"
-        elif option == "Every Hour":
-            cron = "0 * * * *"
-        elif option == "Daily":
-            cron = "0 0 * * *"
-        elif option == "Weekly":
-            cron = "0 0 * * 0"
-        elif option == "Custom":
-            try:
-                hour = int(self.hour_spinbox.get()) % 24
-                minute = int(self.minute_spinbox.get()) % 60
-                cron = f"{minute} {hour} * * *"
-            except ValueError:
-                cron = "Invalid"
-        
+        self._preview_after_id = None
+        cron = self.get_cron_schedule()
         self.cron_preview_label.configure(text=f"⏰ Cron: {cron}")
     
     def load_saved_config(self):
@@ -750,145 +1024,225 @@ class App(ctk.CTk):
         self.update_tasks_list(tasks)
         self.update_dashboard(tasks)
         
-        for task in tasks:
-            if task.enabled:
+        running = self.scheduler.running
+        if running:
+            self.scheduler.pause()
+        
+        enabled = {task.id: task for task in tasks if task.enabled}
+        for task_id, task in list(self._scheduled.items()):
+            if enabled.get(task_id) is not task:
+                self.scheduler.remove_job(task_id)
+                del self._scheduled[task_id]
+        
+        for task in enabled.values():
+            if task.id not in self._scheduled:
                 self.schedule_task(task)
+        
+        if running:
+            self.scheduler.resume()
     
     def update_tasks_list(self, tasks: List[ScreenshotTask]):
-        for widget in self.tasks_list_frame.winfo_children():
-            widget.destroy()
+        current_ids = {task.id for task in tasks}
+        for task_id in list(self._task_rows):
+            if task_id not in current_ids:
+                self._task_rows.pop(task_id)["frame"].destroy()
         
         for task in tasks:
-            task_frame = ctk.CTkFrame(
-                self.tasks_list_frame, 
-                fg_color=COLORS["bg_card"],
-                corner_radius=10
-            )
-            task_frame.pack(fill="x", pady=8, padx=5)
+            row = self._task_rows.get(task.id)
+            if row is None:
+                row = self._task_rows[task.id] = self.create_task_row()
             
-            ctk.CTkLabel(
-                task_frame,
-                text=f"🔗 {task.url}",
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color=COLORS["text_primary"],
-                wraplength=500
-            ).pack(anchor="w", padx=12, pady=(10, 5))
+            row["capture_btn"].configure(command=partial(self.run_capture, task))
+            row["remove_btn"].configure(command=partial(self.remove_task, task.id))
             
-            ctk.CTkLabel(
-                task_frame,
-                text=f"⏱️ {task.cron_schedule} | 📐 {task.width}x{task.height}",
-                font=ctk.CTkFont(size=11),
-                text_color=COLORS["text_secondary"]
-            ).pack(anchor="w", padx=12, pady=(0, 5))
+            state = (task.url, task.cron_schedule, task.enabled, task.width, task.height, task.image_format)
+            if row["state"] == state:
+                continue
+            row["state"] = state
             
             status_text = "✅ Enabled" if task.enabled else "❌ Disabled"
             status_color = COLORS["success"] if task.enabled else COLORS["accent"]
             
-            ctk.CTkLabel(
-                task_frame,
-                text=f"Status: {status_text}",
-                font=ctk.CTkFont(size=11),
-                text_color=status_color
-            ).pack(anchor="w", padx=12, pady=(0, 5))
-            
-            btn_frame = ctk.CTkFrame(task_frame, fg_color="transparent")
-            btn_frame.pack(fill="x", padx=12, pady=(8, 12))
-            
-            capture_btn = ctk.CTkButton(
-                btn_frame,
-                text="📷 Capture Now",
-                width=130,
-                height=35,
-                fg_color=COLORS["secondary"],
-                hover_color=COLORS["primary"],
-                corner_radius=6,
-                command=lambda t=task: self.run_capture(t)
+            row["url_label"].configure(text=f"🔗 {task.url}")
+            row["meta_label"].configure(
+                text=f"⏱️ {task.cron_schedule} | 📐 {task.width}x{task.height} | 🖼️ {task.image_format.upper()}"
             )
-            capture_btn.pack(side="left", padx=(0, 5))
-            
-            remove_btn = ctk.CTkButton(
-                btn_frame,
-                text="🗑️ Delete",
-                width=110,
-                height=35,
-                fg_color=COLORS["accent"],
-                hover_color="#d91e24",
-                corner_radius=6,
-                command=lambda t=task: self.remove_task(t.id)
-            )
-            remove_btn.pack(side="right", padx=(5, 0))
+            row["status_label"].configure(text=f"Status: {status_text}", text_color=status_color)
     
-    def update_dashboard(self, tasks: List[ScreenshotTask]):
-        for widget in self.dashboard_tasks_frame.winfo_children():
-            widget.destroy()
+    def create_task_row(self) -> dict:
+        task_frame = ctk.CTkFrame(
+            self.tasks_list_frame, 
+            fg_color=COLORS["bg_card"],
+            corner_radius=10
+        )
+        task_frame.pack(fill="x", pady=8, padx=5)
+        
+        url_label = ctk.CTkLabel(
+            task_frame,
+            text="",
+            font=self.fonts["s13b"],
+            text_color=COLORS["text_primary"],
+            wraplength=500
+        )
+        url_label.pack(anchor="w", padx=12, pady=(10, 5))
+        
+        meta_label = ctk.CTkLabel(
+            task_frame,
+            text="",
+            font=self.fonts["s11"],
+            text_color=COLORS["text_secondary"]
+        )
+        meta_label.pack(anchor="w", padx=12, pady=(0, 5))
+        
+        status_label = ctk.CTkLabel(
+            task_frame,
+            text="",
+            font=self.fonts["s11"]
+        )
+        status_label.pack(anchor="w", padx=12, pady=(0, 5))
+        
+        btn_frame = ctk.CTkFrame(task_frame, fg_color="transparent")
+        btn_frame.pack(fill="x", padx=12, pady=(8, 12))
+        
+        capture_btn = ctk.CTkButton(
+            btn_frame,
+            text="📷 Capture Now",
+            width=130,
+            height=35,
+            fg_color=COLORS["secondary"],
+            hover_color=COLORS["primary"],
+            corner_radius=6
+        )
+        capture_btn.pack(side="left", padx=(0, 5))
+        
+        remove_btn = ctk.CTkButton(
+            btn_frame,
+            text="🗑️ Delete",
+            width=110,
+            height=35,
+            fg_color=COLORS["accent"],
+            hover_color="#d91e24",
+            corner_radius=6
+        )
+        remove_btn.pack(side="right", padx=(5, 0))
         
+        return {
+            "frame": task_frame,
+            "url_label": url_label,
+            "meta_label": meta_label,
+            "status_label": status_label,
+            "capture_btn": capture_btn,
+            "remove_btn": remove_btn,
+            "state": None
+        }
+    
+    def update_dashboard(self, tasks: List[ScreenshotTask]):
         self.total_tasks_label.configure(text=f"📊 Total Tasks: {len(tasks)}")
         
+        current_ids = {task.id for task in tasks}
+        for task_id in list(self._dashboard_cards):
+            if task_id not in current_ids:
+                self._dashboard_cards.pop(task_id)["frame"].destroy()
+        
         if not tasks:
-            ctk.CTkLabel(
-                self.dashboard_tasks_frame,
-                text="📭 No tasks scheduled. Add a task in the Tasks tab.",
-                font=ctk.CTkFont(size=14),
-                text_color=COLORS["text_secondary"]
-            ).pack(pady=30)
+            if self._dashboard_empty_label is None:
+                self._dashboard_empty_label = ctk.CTkLabel(
+                    self.dashboard_tasks_frame,
+                    text="📭 No tasks scheduled. Add a task in the Tasks tab.",
+                    font=self.fonts["s14"],
+                    text_color=COLORS["text_secondary"]
+                )
+            self._dashboard_empty_label.pack(pady=30)
             return
         
+        if self._dashboard_empty_label is not None:
+            self._dashboard_empty_label.pack_forget()
+        
         for task in tasks:
-            task_card = ctk.CTkFrame(
-                self.dashboard_tasks_frame, 
-                fg_color=COLORS["bg_card_light"],
-                corner_radius=10
-            )
-            task_card.pack(fill="x", pady=8, padx=5)
-            
-            ctk.CTkLabel(
-                task_card,
-                text=f"🔗 {task.url}",
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=COLORS["text_primary"],
-                wraplength=1100
-            ).pack(anchor="w", padx=15, pady=(12, 6))
+            card = self._dashboard_cards.get(task.id)
+            if card is None:
+                card = self._dashboard_cards[task.id] = self.create_dashboard_card()
             
-            ctk.CTkLabel(
-                task_card,
-                text=f"⏱️ Schedule: {task.cron_schedule} | 📐 Size: {task.width}x{task.height}",
-                font=ctk.CTkFont(size=12),
-                text_color=COLORS["text_secondary"]
-            ).pack(anchor="w", padx=15, pady=(0, 6))
+            state = (task.url, task.cron_schedule, task.enabled, task.width, task.height)
+            if card["state"] == state:
+                continue
+            card["state"] = state
             
             status_text = "✅ Enabled" if task.enabled else "❌ Disabled"
             status_color = COLORS["success"] if task.enabled else COLORS["accent"]
             
-            ctk.CTkLabel(
-                task_card,
-                text=f"Status: {status_text}",
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color=status_color
-            ).pack(anchor="w", padx=15, pady=(0, 12))
+            card["url_label"].configure(text=f"🔗 {task.url}")
+            card["meta_label"].configure(
+                text=f"⏱️ Schedule: {task.cron_schedule} | 📐 Size: {task.width}x{task.height}"
+            )
+            card["status_label"].configure(text=f"Status: {status_text}", text_color=status_color)
+    
+    def create_dashboard_card(self) -> dict:
+        task_card = ctk.CTkFrame(
+            self.dashboard_tasks_frame, 
+            fg_color=COLORS["bg_card_light"],
+            corner_radius=10
+        )
+        task_card.pack(fill="x", pady=8, padx=5)
+        
+        url_label = ctk.CTkLabel(
+            task_card,
+            text="",
+            font=self.fonts["s14b"],
+            text_color=COLORS["text_primary"],
+            wraplength=1100
+        )
+        url_label.pack(anchor="w", padx=15, pady=(12, 6))
+        
+        meta_label = ctk.CTkLabel(
+            task_card,
+            text="",
+            font=self.fonts["s12"],
+            text_color=COLORS["text_secondary"]
+        )
+        meta_label.pack(anchor="w", padx=15, pady=(0, 6))
+        
+        status_label = ctk.CTkLabel(
+            task_card,
+            text="",
+            font=self.fonts["s12b"]
+        )
+        status_label.pack(anchor="w", padx=15, pady=(0, 12))
+        
+        return {
+            "frame": task_card,
+            "url_label": url_label,
+            "meta_label": meta_label,
+            "status_label": status_label,
+            "state": None
+        }
     
     def add_task(self):
         url = self.url_entry.get().strip()
         cron = self.get_cron_schedule()
-        width = int(self.width_entry.get())
-        height = int(self.height_entry.get())
+        width = _parse_dim(self.width_entry)
+        height = _parse_dim(self.height_entry)
         
         if not url or cron == "Invalid":
             self.show_error("Please enter a valid URL and schedule")
             return
         
-        output_path = self.output_path_entry.get()
-        if not output_path:
-            output_path = str(Path.home() / "Documents" / "Screenshots")
+        if width is None or height is None:
+            self.show_error("Width and height must be positive whole numbers")
+            return
+        
+        output_path = self.output_path_entry.get() or _DEFAULT_OUTPUT_PATH
         
         task = ScreenshotTask(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             url=url,
             cron_schedule=cron,
             output_path=output_path,
             width=width,
             height=height,
             full_page=self.full_page_var.get(),
-            enabled=True
+            enabled=True,
+            image_format=self.format_option.get().lower()
         )
         
         self.config_manager.add_task(task)
@@ -900,22 +1254,14 @@ class App(ctk.CTk):
     def get_cron_schedule(self):
         option = self.schedule_option.get()
         
-        if option == "Every Minute":
-            return "* * * * *"
-        elif option == "Every Hour":
-            return "0 * * * *"
-        elif option == "Daily":
-            return "0 0 * * *"
-        elif option == "Weekly":
-            return "0 0 * * 0"
-        elif option == "Custom":
+        if option == "Custom":
             try:
                 hour = int(self.hour_spinbox.get()) % 24
                 minute = int(self.minute_spinbox.get()) % 60
                 return f"{minute} {hour} * * *"
             except ValueError:
                 return "Invalid"
-        return "0 * * * *"
+        return _SCHEDULE_MAP.get(option, "0 * * * *")
     
     def remove_task(self, task_id: str):
         self.config_manager.remove_task(task_id)
@@ -928,86 +1274,68 @@ class App(ctk.CTk):
         self.hour_spinbox.set("00")
         self.minute_spinbox.set("00")
         self.date_entry.delete(0, "end")
-        self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self.date_entry.insert(0, self._today_str)
         self.custom_schedule_frame.pack_forget()
         self.update_cron_preview()
     
     def schedule_task(self, task: ScreenshotTask):
+        if not _is_valid_cron(task.cron_schedule):
+            print(f"Failed to schedule task: invalid cron '{task.cron_schedule}' for {task.url}")
+            return
+        
         try:
-            cron_parts = task.cron_schedule.split()
-            if len(cron_parts) != 5:
-                raise ValueError("Invalid cron format")
-            
-            minute, hour, day, month, day_of_week = cron_parts
-            
-            def capture_wrapper():
-                acquired = self.capture._capture_lock.acquire(blocking=False)
-                if not acquired:
-                    print(f"Capture already in progress for {task.url}, skipping")
-                    return
-                
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        loop.run_until_complete(self.capture_task(task))
-                    finally:
-                        loop.close()
-                finally:
-                    self.capture._capture_lock.release()
-            
             self.scheduler.add_job(
-                capture_wrapper,
-                trigger=CronTrigger(
-                    minute=minute,
-                    hour=hour,
-                    day=day,
-                    month=month,
-                    day_of_week=day_of_week
-                ),
+                self.capture_task,
+                trigger=_make_cron_trigger(task.cron_schedule),
+                args=[task],
                 id=task.id,
                 max_instances=1,
+                coalesce=True,
+                misfire_grace_time=60,
                 replace_existing=True
             )
+            self._scheduled[task.id] = task
             print(f"Scheduled task: {task.url} at {task.cron_schedule}")
         except Exception as e:
             print(f"Failed to schedule task: {e}")
     
     async def capture_task(self, task: ScreenshotTask):
-        self.status_label.configure(text=f"📸 Capturing: {task.url}...")
-        self.update()
+        if task.id in self._capturing:
+            print(f"Capture already in progress for {task.url}, skipping")
+            return
+        
+        self.set_status(f"📸 Capturing: {task.url}...")
         
-        success = await self.capture.capture(task)
+        self._capturing.add(task.id)
+        try:
+            success = await self.capture.capture(task)
+        finally:
+            self._capturing.discard(task.id)
         
         if success:
-            self.status_label.configure(text=f"✅ Capture successful: {task.url}")
+            self.set_status(f"✅ Capture successful: {task.url}")
         else:
-            self.status_label.configure(text=f"❌ Capture failed: {task.url}")
-        
-        self.update()
+            self.set_status(f"❌ Capture failed: {task.url}")
+    
+    def set_status(self, text: str):
+        self._status_queue.put(text)
+    
+    def poll_status(self):
+        text = None
+        try:
+            while True:
+                text = self._status_queue.get_nowait()
+        except queue.Empty:
+            pass
+        
+        if text is not None:
+            self.status_label.configure(text=text)
+        self._status_after_id = self.after(100, self.poll_status)
     
     def run_capture(self, task: ScreenshotTask):
-        def capture():
-            acquired = self.capture._capture_lock.acquire(blocking=False)
-            if not acquired:
-                print(f"Capture already in progress for {task.url}, skipping")
-                return
-            
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(self.capture_task(task))
-                finally:
-                    loop.close()
-            finally:
-                self.capture._capture_lock.release()
-        
-        thread = threading.Thread(target=capture)
-        thread.start()
+        asyncio.run_coroutine_threadsafe(self.capture_task(task), self._loop)
     
     def browse_output_dir(self):
-        from tkinter import filedialog
         path = filedialog.askdirectory()
         if path:
             self.output_path_entry.delete(0, "end")
@@ -1016,8 +1344,9 @@ class App(ctk.CTk):
     def save_settings(self):
         output_dir = self.output_path_entry.get()
         if output_dir:
-            self.config_manager.config["output_directory"] = output_dir
-            self.config_manager.save_config()
+            if self.config_manager.config.get("output_directory") != output_dir:
+                self.config_manager.config["output_directory"] = output_dir
+                self.config_manager.save_config()
             self.show_success("Settings saved")
     
     def toggle_dark_mode(self):
@@ -1030,70 +1359,95 @@ class App(ctk.CTk):
         self.config_manager.save_config()
     
     def show_success(self, message: str):
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("Success")
-        dialog.geometry("400x200")
-        dialog.transient(self)
-        dialog.grab_set()
-        
-        dialog.grid_columnconfigure(0, weight=1)
+        if self._success_dialog is None:
+            dialog = ctk.CTkToplevel(self)
+            dialog.title("Success")
+            dialog.geometry("400x200")
+            dialog.transient(self)
+            dialog.protocol("WM_DELETE_WINDOW", partial(self.hide_dialog, dialog))
+            
+            dialog.grid_columnconfigure(0, weight=1)
+            
+            dialog.label = ctk.CTkLabel(
+                dialog, 
+                text="", 
+                font=self.fonts["s16"],
+                text_color=COLORS["success"]
+            )
+            dialog.label.pack(pady=40, padx=20)
+            ctk.CTkButton(
+                dialog, 
+                text="OK", 
+                command=partial(self.hide_dialog, dialog),
+                width=100,
+                height=40,
+                fg_color=COLORS["success"],
+                hover_color="#2ea070",
+                corner_radius=8
+            ).pack(pady=20)
+            self._success_dialog = dialog
+        else:
+            self._success_dialog.deiconify()
         
-        ctk.CTkLabel(
-            dialog, 
-            text=f"✅ {message}", 
-            font=ctk.CTkFont(size=16),
-            text_color=COLORS["success"]
-        ).pack(pady=40, padx=20)
-        ctk.CTkButton(
-            dialog, 
-            text="OK", 
-            command=dialog.destroy,
-            width=100,
-            height=40,
-            fg_color=COLORS["success"],
-            hover_color="#2ea070",
-            corner_radius=8
-        ).pack(pady=20)
+        self._success_dialog.label.configure(text=f"✅ {message}")
+        self._success_dialog.grab_set()
     
     def show_error(self, message: str):
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("Error")
-        dialog.geometry("450x220")
-        dialog.transient(self)
-        dialog.grab_set()
-        
-        dialog.grid_columnconfigure(0, weight=1)
+        if self._error_dialog is None:
+            dialog = ctk.CTkToplevel(self)
+            dialog.title("Error")
+            dialog.geometry("450x220")
+            dialog.transient(self)
+            dialog.protocol("WM_DELETE_WINDOW", partial(self.hide_dialog, dialog))
+            
+            dialog.grid_columnconfigure(0, weight=1)
+            
+            dialog.label = ctk.CTkLabel(
+                dialog,
+                text="",
+                font=self.fonts["s15"],
+                text_color=COLORS["accent"],
+                wraplength=400
+            )
+            dialog.label.pack(pady=40, padx=20)
+            ctk.CTkButton(
+                dialog, 
+                text="OK", 
+                command=partial(self.hide_dialog, dialog),
+                width=100,
+                height=40,
+                fg_color=COLORS["accent"],
+                hover_color="#d91e24",
+                corner_radius=8
+            ).pack(pady=20)
+            self._error_dialog = dialog
+        else:
+            self._error_dialog.deiconify()
         
-        ctk.CTkLabel(
-            dialog,
-            text=f"❌ {message}",
-            font=ctk.CTkFont(size=15),
-            text_color=COLORS["accent"],
-            wraplength=400
-        ).pack(pady=40, padx=20)
-        ctk.CTkButton(
-            dialog, 
-            text="OK", 
-            command=dialog.destroy,
-            width=100,
-            height=40,
-            fg_color=COLORS["accent"],
-            hover_color="#d91e24",
-            corner_radius=8
-        ).pack(pady=20)
+        self._error_dialog.label.configure(text=f"❌ {message}")
+        self._error_dialog.grab_set()
+    
+    def hide_dialog(self, dialog):
+        dialog.grab_release()
+        dialog.withdraw()
     
     def on_close(self):
-        self.scheduler.shutdown()
+        self._loop.call_soon_threadsafe(partial(self.scheduler.shutdown, wait=False))
+        self.config_manager.flush()
         
-        def close_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(self.capture.close())
-            finally:
-                loop.close()
+        try:
+            asyncio.run_coroutine_threadsafe(self.capture.close(), self._loop).result(timeout=5)
+        except Exception as e:
+            print(f"Error closing browser: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=5)
+        if not self._loop.is_running():
+            self._loop.close()
+        
+        for after_id in (self._status_after_id, self._today_after_id, self._preview_after_id):
+            if after_id:
+                self.after_cancel(after_id)
         
-        close_async()
         super().destroy()
 
 